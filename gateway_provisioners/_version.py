@@ -1,16 +1,15 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
-import re
+from itertools import takewhile
 from typing import List
 
 # Version string must appear intact for automatic versioning
 __version__ = "0.5.0.dev0"
 
 # Build up version_info tuple for backwards compatibility
-pattern = r"(?P<major>\d+).(?P<minor>\d+).(?P<patch>\d+)(?P<rest>.*)"
-match = re.match(pattern, __version__)
-assert match is not None
-parts: List[object] = [int(match[part]) for part in ["major", "minor", "patch"]]
-if match["rest"]:
-    parts.append(match["rest"])
+_major, _minor, _remainder = __version__.split(".", 2)
+_patch = "".join(takewhile(str.isdigit, _remainder))
+parts: List[object] = [int(_major), int(_minor), int(_patch)]
+if _remainder[len(_patch) :]:
+    parts.append(_remainder[len(_patch) :])
 version_info = tuple(parts)
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import shutil
 import sys
 import tempfile
-from glob import glob
 from string import Template
 from typing import Any
 
@@ -24,6 +24,16 @@ kernel_launchers_dir = os.path.join(os.path.dirname(__file__), "..", "kernel-lau
 kernel_resources_dir = os.path.join(os.path.dirname(__file__), "..", "kernel-resources")
 kernel_specs_dir = os.path.join(os.path.dirname(__file__), "..", "kernel-specs")
 
+# Launcher directories that are never installed - e.g., source code and bytecode caches
+LAUNCHER_IGNORED_DIRS = frozenset({"toree-launcher", "__pycache__"})
+
+# Valid kernel names, matching what KernelSpecManager.install_kernel_spec() accepts
+kernel_name_pattern = re.compile(r"^[a-z0-9._\-]+$", re.IGNORECASE)
+kernel_name_description = (
+    "Kernel names can only contain ASCII letters and numbers and these separators: "
+    "- . _ (hyphen, period, and underscore)."
+)
+
 launcher_dirs = ["python", "r", "scala", "kubernetes", "docker", "operators"]
 resource_dirs = ["python", "r", "scala"]
 
@@ -32,11 +42,15 @@ PYTHON = "python"
 SCALA = "scala"
 R = "r"
 DEFAULT_LANGUAGE = PYTHON
-SUPPORTED_LANGUAGES = [PYTHON, SCALA, R]
+SUPPORTED_LANGUAGES = frozenset({PYTHON, SCALA, R})
 DEFAULT_INIT_MODE = "lazy"
 SPARK_INIT_MODES = [DEFAULT_INIT_MODE, "eager", "none"]
 LANGUAGE_SUBSTITUTIONS = {PYTHON: PYTHON, R: "R", SCALA: SCALA}
 DEFAULT_PYTHON_KERNEL_CLASS_NAME = "ipykernel.ipkernel.IPythonKernel"
+# Tag used for images, "dev" for development versions, else the version (including pre-releases)
+IMAGE_TAG = "dev" if "dev" in __version__ else __version__
+# Matches the (non-JSON) comments permitted in kernel.json templates
+COMMENT_PATTERN = re.compile(r"#[^\n]*")
 
 
 class BaseApp(JupyterApp):
@@ -101,7 +115,17 @@ class BaseApp(JupyterApp):
         else:
             toree_version = toree.toreeapp.ToreeApp.version
             toree_lib_dir = os.path.join(os.path.dirname(toree.__file__), "lib")
-            jars = glob(os.path.join(toree_lib_dir, f"toree-assembly-{toree_version}-*.jar"))
+            # Equivalent to the pattern 'toree-assembly-{toree_version}-*.jar'
+            jar_prefix = f"toree-assembly-{toree_version}-"
+            try:
+                with os.scandir(toree_lib_dir) as entries:
+                    jars = [
+                        entry.path
+                        for entry in entries
+                        if entry.name.startswith(jar_prefix) and entry.name.endswith(".jar")
+                    ]
+            except FileNotFoundError:
+                jars = []
             if len(jars) < 1:
                 self.log.warning(
                     "The Apache Torre kernel package is installed, but there doesn't appear to be a toree "
@@ -135,31 +159,22 @@ class BaseApp(JupyterApp):
     def _copy_launcher_files(self, launcher_dir_name: str, target_dir: str):
         """Copy the launcher files from the launcher directory to the destination staging directory."""
 
+        # The toree-launcher source code (scala) and any __pycache__ directories in the
+        # launcher 'scripts' directory are not needed by the kernel, so are not copied.
         src_dir = os.path.join(kernel_launchers_dir, launcher_dir_name)
-        shutil.copytree(src=src_dir, dst=target_dir, dirs_exist_ok=True)
+        self._fast_copytree(src_dir, target_dir, ignore=LAUNCHER_IGNORED_DIRS)
 
         # When the launcher_dir_name is either 'r' or 'python', we need to also copy the files
         # from the 'shared' launcher directory.
-        if launcher_dir_name.lower() in [PYTHON, R]:
+        if launcher_dir_name.lower() in (PYTHON, R):
             src_dir = os.path.join(kernel_launchers_dir, "shared")
-            shutil.copytree(src=src_dir, dst=target_dir, dirs_exist_ok=True)
-        # When the launcher_dir_name is 'scala', we need to copy the toree jar (if determined), and
-        # remove the toree-launcher source code from the staging dir.
-        if launcher_dir_name in [SCALA]:
-            if self.toree_jar_path:
-                shutil.copyfile(
-                    self.toree_jar_path,
-                    os.path.join(target_dir, "lib", os.path.basename(self.toree_jar_path)),
-                )
-            scala_src_dir = os.path.join(target_dir, "toree-launcher")
-            if os.path.isdir(scala_src_dir):
-                self._delete_directory(scala_src_dir)
-
-        # The source launcher 'scripts' directory may contain a __pycache__ directory.
-        # Check for this condition in the staging area and delete the directory if present.
-        pycache_dir = os.path.join(target_dir, "scripts", "__pycache__")
-        if os.path.isdir(pycache_dir):
-            self._delete_directory(pycache_dir)
+            self._fast_copytree(src_dir, target_dir, ignore=LAUNCHER_IGNORED_DIRS)
+        # When the launcher_dir_name is 'scala', we need to copy the toree jar (if determined).
+        if launcher_dir_name == SCALA and self.toree_jar_path:
+            shutil.copyfile(
+                self.toree_jar_path,
+                os.path.join(target_dir, "lib", os.path.basename(self.toree_jar_path)),
+            )
 
     def log_and_exit(self, msg, exit_status=1):
         """Logs the msg as an error and exits with the given exit-status."""
@@ -174,6 +189,30 @@ class BaseApp(JupyterApp):
         """
         return tempfile.mkdtemp(prefix="staging_", dir=parent_dir)
 
+    @staticmethod
+    def _fast_copytree(src: str, dst: str, ignore: frozenset[str] = frozenset()) -> None:
+        """Copies the directory tree rooted at `src` into `dst`, merging with any existing content.
+
+        Entries whose name is in `ignore` are skipped, at any level of the tree.  Unlike
+        `shutil.copytree`, the tree is walked using the `DirEntry` objects produced by
+        `os.scandir` (avoiding a separate `stat` per entry) and no directory metadata is copied.
+        Files retain their permission bits (launch scripts must remain executable) but not their
+        timestamps or other metadata.
+        """
+        pending_dirs = [(src, dst)]
+        while pending_dirs:
+            src_dir, dst_dir = pending_dirs.pop()
+            os.makedirs(dst_dir, exist_ok=True)
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    if entry.name in ignore:
+                        continue
+                    dst_path = os.path.join(dst_dir, entry.name)
+                    if entry.is_dir():
+                        pending_dirs.append((entry.path, dst_path))
+                    else:
+                        shutil.copy(entry.path, dst_path)
+
     @staticmethod
     def _delete_directory(dir_name):
         """Deletes the specified directory."""
@@ -215,9 +254,7 @@ class BaseApp(JupyterApp):
         If the version indicates a development version, the tag will be "dev",
         else the tag will represent the version, including pre-releases like 2.0.0rc1
         """
-        if "dev" in __version__:
-            return "dev"
-        return __version__
+        return IMAGE_TAG
 
 
 class BaseSpecApp(RemoteProvisionerConfigMixin, BaseApp):
@@ -231,7 +268,7 @@ class BaseSpecApp(RemoteProvisionerConfigMixin, BaseApp):
     )
 
     language = Unicode(
-        "Python",
+        DEFAULT_LANGUAGE,
         config=True,
         help="""The language of the kernel referenced in the kernel specification.  Must be one of
     'Python', 'R', or 'Scala'.  Default = 'Python'.""",
@@ -240,12 +277,10 @@ class BaseSpecApp(RemoteProvisionerConfigMixin, BaseApp):
     @validate("language")
     def _language_validate(self, proposal: dict[str, str]) -> str:
         value = proposal["value"]
-        try:
-            assert value.lower() in SUPPORTED_LANGUAGES
-        except AssertionError as ae:
-            err_msg = f"Invalid language value {value}, not in {SUPPORTED_LANGUAGES}"
-            raise TraitError(err_msg) from ae
-        return value
+        if value.lower() not in SUPPORTED_LANGUAGES:
+            err_msg = f"Invalid language value {value}, not in {sorted(SUPPORTED_LANGUAGES)}"
+            raise TraitError(err_msg)
+        return value.lower()  # always use lowercase form
 
     ipykernel_subclass_name = Unicode(
         DEFAULT_PYTHON_KERNEL_CLASS_NAME,
@@ -308,7 +343,7 @@ class BaseSpecApp(RemoteProvisionerConfigMixin, BaseApp):
             self.log_and_exit("Can't specify both user and prefix. Please choose one or the other.")
 
         if self.ipykernel_subclass_name != DEFAULT_PYTHON_KERNEL_CLASS_NAME:
-            if self.language.lower() != PYTHON:
+            if self.language != PYTHON:
                 self.log.warning(
                     "--ipykernel_subclass_name will be ignored since --language is not Python."
                 )
@@ -331,39 +366,42 @@ class BaseSpecApp(RemoteProvisionerConfigMixin, BaseApp):
 
     @overrides
     def detect_missing_extras(self):
-        if self.launcher_dir_name in [SCALA]:
+        if self.launcher_dir_name == SCALA:
             self._detect_missing_toree_jar()
 
-        if self.launcher_dir_name in [R]:
+        if self.launcher_dir_name == R:
             self._detect_missing_rscript()
 
     @overrides
     def install_files(self):
         """Assembles kernel-specs, launchers and resources into staging directory, then installs as kernel-spec."""
 
-        # Before setting up staging area, check if kernel spec already exists and no replacement has been requested
-        dest_dir, temp_dir = self._replace_existing()
-
-        # create staging dir
-        staging_dir = self._create_staging_directory()
+        if not kernel_name_pattern.match(self.kernel_name):
+            self.log_and_exit(
+                f"Invalid kernel name '{self.kernel_name}'.  {kernel_name_description}"
+            )
 
-        # copy appropriate resource files
-        self._copy_kernel_spec_files(staging_dir)
+        # Before copying any files, check if kernel spec already exists and no replacement has been requested
+        dest_dir, temp_dir = self._replace_existing()
 
         try:
             # install to destination
             self.log.info(f"Installing kernel specification for '{self.display_name}'")
-            self.install_dir = self.kernel_spec_manager.install_kernel_spec(
-                staging_dir,
-                kernel_name=self.kernel_name,
-                user=self.user,
-                prefix=self.prefix,
-            )
-            self._delete_directory(staging_dir)
+            if (
+                type(self.kernel_spec_manager).install_kernel_spec
+                is KernelSpecManager.install_kernel_spec
+            ):
+                # The destination is known, so copy directly to it rather than assembling the files
+                # in a staging directory that install_kernel_spec() would then copy a second time.
+                self.install_dir = self._install_kernel_spec_files(dest_dir)
+            else:
+                # A KernelSpecManager that overrides install_kernel_spec() may install elsewhere,
+                # so let it perform the install.
+                self.install_dir = self._install_staged_kernel_spec_files()
             # If we're installing a scala kernel and don't have the toree jar file, issue
             # a warning indicating that the scala kernel needs that file in its kernelspec
             # directory hierarchy.
-            if self.launcher_dir_name in [SCALA] and not self.toree_jar_path:
+            if self.launcher_dir_name == SCALA and not self.toree_jar_path:
                 kspec_toree_jar_location = os.path.join(self.install_dir, "lib")
                 self.log.warning(
                     "The Apache Toree kernel is either not installed or it's jar file cannot be determined. "
@@ -374,20 +412,56 @@ class BaseSpecApp(RemoteProvisionerConfigMixin, BaseApp):
             self._finalize_kernel_json()
 
         except Exception as ex:
-            # We encountered an exception.  If we're in replace mode, revert temp directory back to destination
-            if temp_dir:
-                shutil.rmtree(dest_dir)
-                shutil.copytree(src=temp_dir, dst=dest_dir, dirs_exist_ok=True)
-                self.log.warning(
-                    f"An exception was encountered while finalizing the kernel specification and "
-                    f"the previous contents have been restored. The exception was: {ex}"
-                )
+            # We encountered an exception.  Remove any partially installed files and, if we're in
+            # replace mode, revert temp directory back to destination
+            shutil.rmtree(dest_dir, ignore_errors=True)
+            if not temp_dir:
+                raise
+            shutil.copytree(src=temp_dir, dst=dest_dir, dirs_exist_ok=True)
+            self.log.warning(
+                f"An exception was encountered while finalizing the kernel specification and "
+                f"the previous contents have been restored. The exception was: {ex}"
+            )
         finally:
             if temp_dir:
                 shutil.rmtree(temp_dir)
 
-    def _copy_kernel_spec_files(self, staging_dir: str):
-        """Copies the launcher, resource and kernel-spec files to the staging directory."""
+    def _install_kernel_spec_files(self, dest_dir: str) -> str:
+        """Copies the kernel-spec files directly into dest_dir, replacing any existing kernel-spec.
+
+        This mirrors what KernelSpecManager.install_kernel_spec() does with a staging directory.
+        """
+        kernel_name = os.path.basename(dest_dir)
+        kernel_dir = os.path.dirname(dest_dir)
+        if kernel_dir not in self.kernel_spec_manager.kernel_dirs:
+            self.log.warning(
+                f"Installing to {kernel_dir}, which is not in {self.kernel_spec_manager.kernel_dirs}. "
+                "The kernelspec may not be found."
+            )
+        if os.path.isdir(dest_dir):
+            self.log.info(f"Removing existing kernelspec in {dest_dir}")
+            shutil.rmtree(dest_dir)
+
+        self._copy_kernel_spec_files(dest_dir)
+        self.log.info(f"Installed kernelspec {kernel_name} in {dest_dir}")
+        return dest_dir
+
+    def _install_staged_kernel_spec_files(self) -> str:
+        """Assembles the kernel-spec files in a staging directory, then installs them via the kernel_spec_manager."""
+        staging_dir = self._create_staging_directory()
+        try:
+            self._copy_kernel_spec_files(staging_dir)
+            return self.kernel_spec_manager.install_kernel_spec(
+                staging_dir,
+                kernel_name=self.kernel_name,
+                user=self.user,
+                prefix=self.prefix,
+            )
+        finally:
+            self._delete_directory(staging_dir)
+
+    def _copy_kernel_spec_files(self, target_dir: str):
+        """Copies the launcher, resource and kernel-spec files to the target directory."""
 
         if any(
             dir_name is None
@@ -418,27 +492,23 @@ class BaseSpecApp(RemoteProvisionerConfigMixin, BaseApp):
             raise ValueError(err_msg)
 
         # Copy the launcher files
-        self._copy_launcher_files(self.launcher_dir_name, staging_dir)
+        self._copy_launcher_files(self.launcher_dir_name, target_dir)
 
         # Copy the resource files
         src_dir = os.path.join(kernel_resources_dir, self.resource_dir_name)
-        shutil.copytree(src=src_dir, dst=staging_dir, dirs_exist_ok=True)
+        self._fast_copytree(src_dir, target_dir)
 
         # Copy the kernel-spec files
         src_dir = os.path.join(kernel_specs_dir, self.kernel_spec_dir_name)
-        shutil.copytree(src=src_dir, dst=staging_dir, dirs_exist_ok=True)
+        self._fast_copytree(src_dir, target_dir)
 
     def _finalize_kernel_json(self):
         """Apply substitutions to the kernel.json string, update a kernel spec using these values,
         then write to the target kernel.json file.
         """
         subs = self.get_substitutions(self.install_dir)
-        kernel_json_str = ""
         with open(os.path.join(self.install_dir, KERNEL_JSON)) as f:
-            for line in f:
-                line = line.split("#", 1)[0]
-                kernel_json_str = kernel_json_str + line
-            f.close()
+            kernel_json_str = COMMENT_PATTERN.sub("", f.read())
         post_subs = Template(kernel_json_str).safe_substitute(subs)
         kernel_json = json.loads(post_subs)
 
@@ -454,9 +524,13 @@ class BaseSpecApp(RemoteProvisionerConfigMixin, BaseApp):
 
         kernel_json_file = os.path.join(self.install_dir, KERNEL_JSON)
         self.log.debug(f"Finalizing kernel json file for kernel: '{self.display_name}'")
-        with open(kernel_json_file, "w+") as f:
+        # Write to a sibling file, then rename it over kernel.json so readers (e.g., a running
+        # server scanning kernel specs) never see a partially written file.
+        kernel_json_tmp_file = f"{kernel_json_file}.tmp"
+        with open(kernel_json_tmp_file, "w") as f:
             json.dump(kernel_spec, f, indent=2)
             f.write("\n")
+        os.replace(kernel_json_tmp_file, kernel_json_file)
 
     def add_optional_config_entries(self, config_stanza: dict) -> None:
         """
@@ -464,14 +538,12 @@ class BaseSpecApp(RemoteProvisionerConfigMixin, BaseApp):
 
         This method is overridden by subclasses which should call super().add_optional_config_entries().
         """
-        if (
-            self.authorized_users
-            and list(self.authorized_users) != self._authorized_users_default()
-        ):
+        # The user traits and their defaults are sets, so ordering doesn't affect the comparison
+        if self.authorized_users and self.authorized_users != self._authorized_users_default():
             config_stanza["authorized_users"] = list(self.authorized_users)
         if (
             self.unauthorized_users
-            and list(self.unauthorized_users) != self._unauthorized_users_default()
+            and self.unauthorized_users != self._unauthorized_users_default()
         ):
             config_stanza["unauthorized_users"] = list(self.unauthorized_users)
         if self.port_range and self.port_range != self.port_range_default_value:
@@ -488,7 +560,7 @@ class BaseSpecApp(RemoteProvisionerConfigMixin, BaseApp):
         substitutions = {}
         substitutions["display_name"] = self.display_name
         substitutions["install_dir"] = install_dir
-        substitutions["language"] = LANGUAGE_SUBSTITUTIONS[self.language.lower()]
+        substitutions["language"] = LANGUAGE_SUBSTITUTIONS[self.language]
         substitutions["ipykernel_subclass_name"] = self.ipykernel_subclass_name
         return substitutions
 
@@ -509,15 +581,17 @@ class BaseSpecApp(RemoteProvisionerConfigMixin, BaseApp):
         return destination_dir, temp_dir
 
     def _get_destination_dir(self) -> str:
-        """This method is essentially oa copy of `_get_destination_dir` from jupyter_client/kernelspec.py"""
+        """This method is essentially a copy of `_get_destination_dir` from jupyter_client/kernelspec.py"""
+        # Like install_kernel_spec(), kernel names are always installed in lowercase
+        kernel_name = self.kernel_name.lower()
         if self.user:
-            return os.path.join(jupyter_data_dir(), "kernels", self.kernel_name)
+            return os.path.join(jupyter_data_dir(), "kernels", kernel_name)
         elif self.prefix:
             return os.path.join(
-                os.path.abspath(self.prefix), "share", "jupyter", "kernels", self.kernel_name
+                os.path.abspath(self.prefix), "share", "jupyter", "kernels", kernel_name
             )
         else:
-            return os.path.join(SYSTEM_JUPYTER_PATH[0], "kernels", self.kernel_name)
+            return os.path.join(SYSTEM_JUPYTER_PATH[0], "kernels", kernel_name)
 
 
 class BaseSpecSparkApp(BaseSpecApp):
@@ -1,6 +1,7 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
 import os
+from importlib.util import find_spec
 
 from jupyter_core.application import JupyterApp
 from overrides import overrides
@@ -88,9 +89,7 @@ enabled for Spark usage, this image will be the driver image. (GP_IMAGE_NAME env
     @overrides
     def detect_missing_extras(self):
         super().detect_missing_extras()
-        try:
-            import docker  # type:ignore[import-untyped] # noqa: F401
-        except ImportError:
+        if find_spec("docker") is None:
             self.log.warning(
                 "The extra package 'docker' is not installed in this environment and is required.  "
                 "Ensure that gateway_provisioners is installed by specifying the extra 'docker' "
@@ -101,7 +100,6 @@ enabled for Spark usage, this image will be the driver image. (GP_IMAGE_NAME env
     def validate_parameters(self):
         super().validate_parameters()
 
-        self.language = self.language.lower()
         self.launcher_dir_name = "docker"
         self.resource_dir_name = self.language
 
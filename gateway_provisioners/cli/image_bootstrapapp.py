@@ -1,7 +1,6 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
 import os
-import shutil
 from string import Template
 from typing import Any
 
@@ -45,7 +44,7 @@ jupyter-image-bootstrap install --languages=Python --languages=Scala
 
     languages = List(
         Unicode(),
-        ["Python"],
+        [PYTHON],
         config=True,
         help="""The languages corresponding to the kernel-launchers to install into the kernel image.
     All values must be one of 'Python', 'R', or 'Scala'.""",
@@ -54,16 +53,13 @@ jupyter-image-bootstrap install --languages=Python --languages=Scala
     @validate("languages")
     def _languages_validate(self, proposal: dict[str, Any]) -> List:
         value = proposal["value"]
-        try:
-            for lang in value:
-                assert lang.lower() in SUPPORTED_LANGUAGES
-        except AssertionError as ae:
+        if any(lang.lower() not in SUPPORTED_LANGUAGES for lang in value):
             err_msg = (
                 f"Invalid languages value {value}, at least one of which is "
-                f"not in {SUPPORTED_LANGUAGES} (case-insensitive)"
+                f"not in {sorted(SUPPORTED_LANGUAGES)} (case-insensitive)"
             )
-            raise TraitError(err_msg) from ae
-        return value
+            raise TraitError(err_msg)
+        return [lang.lower() for lang in value]  # always use lowercase form
 
     launchers_only = Bool(
         False, config=True, help="Only install kernel launchers, no bootstrap script."
@@ -87,9 +83,9 @@ jupyter-image-bootstrap install --languages=Python --languages=Scala
     @overrides
     def detect_missing_extras(self):
         for lang in self.languages:
-            if lang.lower() == SCALA:
+            if lang == SCALA:
                 self._detect_missing_toree_jar()
-            elif lang.lower() == R:
+            elif lang == R:
                 self._detect_missing_rscript()
 
     @overrides
@@ -98,7 +94,7 @@ jupyter-image-bootstrap install --languages=Python --languages=Scala
 
         parent_dir = os.path.join(BOOTSTRAP_DIR, "kernel-launchers")
         for lang in self.languages:
-            lang_dir_name = LANG_DIR_NAMES.get(lang.lower())
+            lang_dir_name = LANG_DIR_NAMES.get(lang)
             if not lang_dir_name:
                 continue
             target_dir = os.path.join(parent_dir, lang_dir_name)
@@ -122,23 +118,20 @@ jupyter-image-bootstrap install --languages=Python --languages=Scala
         if not self.launchers_only:
             bootstrap_file = os.path.join(kernel_launchers_dir, "bootstrap", BOOTSTRAP_FILE_NAME)
             target_bootstrap_file = os.path.join(BOOTSTRAP_DIR, BOOTSTRAP_FILE_NAME)
-            shutil.copyfile(bootstrap_file, target_bootstrap_file)
-            self._finalize_bootstrap(target_bootstrap_file)
+            self._finalize_bootstrap(bootstrap_file, target_bootstrap_file)
             self.log.info(f"{BOOTSTRAP_FILE_NAME} has been copied to {BOOTSTRAP_DIR}.")
             self.log.info(
                 f"The CMD entry in the Dockerfile should be updated to: CMD {target_bootstrap_file}"
             )
 
     @staticmethod
-    def _finalize_bootstrap(bootstrap_file: str):
+    def _finalize_bootstrap(bootstrap_file: str, target_bootstrap_file: str):
+        """Writes the bootstrap script to its target location, applying substitutions on the way."""
         subs = {"install_dir": BOOTSTRAP_DIR}
-        bootstrap_str = ""
         with open(bootstrap_file) as f:
-            for line in f:
-                bootstrap_str = bootstrap_str + line
-            f.close()
+            bootstrap_str = f.read()
         post_subs = Template(bootstrap_str).safe_substitute(subs)
-        with open(bootstrap_file, "w+") as f:
+        with open(target_bootstrap_file, "w") as f:
             f.write(post_subs)
 
 
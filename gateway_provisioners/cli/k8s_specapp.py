@@ -1,6 +1,7 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
 import os
+from importlib.util import find_spec
 
 from jupyter_core.application import JupyterApp
 from overrides import overrides
@@ -145,10 +146,7 @@ will configure the SparkOperatorProvisioner for Spark Application CRDs.""",
     @overrides
     def detect_missing_extras(self):
         super().detect_missing_extras()
-        try:
-            import jinja2  # noqa: F401
-            import kubernetes  # type:ignore[import-untyped] # noqa: F401
-        except ImportError:
+        if find_spec("jinja2") is None or find_spec("kubernetes") is None:
             self.log.warning(
                 "At least one of the extra packages 'kubernetes' or 'jinja2' are not installed in "
                 "this environment and are required.  Ensure that gateway_provisioners is installed "
@@ -159,8 +157,6 @@ will configure the SparkOperatorProvisioner for Spark Application CRDs.""",
     def validate_parameters(self):
         super().validate_parameters()
 
-        entered_language = self.language
-        self.language = self.language.lower()
         self.launcher_dir_name = "kubernetes"
         self.resource_dir_name = self.language
 
@@ -173,7 +169,7 @@ will configure the SparkOperatorProvisioner for Spark Application CRDs.""",
                 raise RuntimeError(reason)
             if self.language != PYTHON:
                 self.log.warning(
-                    f"CRD support only works with Python, changing language from {entered_language} to Python."
+                    f"CRD support only works with Python, changing language from {self.language} to Python."
                 )
                 self.language = PYTHON
             # if kernel and display names are still defaulted, silently convert to lang default and append spark suffix
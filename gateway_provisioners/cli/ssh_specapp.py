@@ -74,7 +74,6 @@ each be specified via separate options: --remote-hosts host1 --remote-hosts host
     def validate_parameters(self):
         super().validate_parameters()
 
-        self.language = self.language.lower()
         self.launcher_dir_name = self.language
         self.resource_dir_name = self.language
 
@@ -2,6 +2,7 @@
 # Distributed under the terms of the Modified BSD License.
 import os
 import sys
+from importlib.util import find_spec
 
 from jupyter_core.application import JupyterApp
 from overrides import overrides
@@ -102,12 +103,11 @@ HADOOP_CONFIG_DIR to determine the active resource manager.
 
     @default("yarn_endpoint_security_enabled")
     def _yarn_endpoint_security_enabled_default(self):
-        return bool(
-            os.getenv(
-                self.yarn_endpoint_security_enabled_env,
-                self.yarn_endpoint_security_enabled_default_value,
-            )
-        )
+        # Any set value other than "true" (case-insensitive), including "false", disables security
+        value = os.getenv(self.yarn_endpoint_security_enabled_env)
+        if value is None:
+            return self.yarn_endpoint_security_enabled_default_value
+        return value.lower() == "true"
 
     # Impersonation enabled
     impersonation_enabled_env = "GP_IMPERSONATION_ENABLED"
@@ -151,9 +151,7 @@ HADOOP_CONFIG_DIR to determine the active resource manager.
     @overrides
     def detect_missing_extras(self):
         super().detect_missing_extras()
-        try:
-            import yarn_api_client  # type:ignore[import-untyped] # noqa: F401
-        except ImportError:
+        if find_spec("yarn_api_client") is None:
             self.log.warning(
                 "The extra package 'yarn_api_client'is not installed in this environment and is "
                 "required.  Ensure that gateway_provisioners is installed by specifying the "
@@ -164,17 +162,13 @@ HADOOP_CONFIG_DIR to determine the active resource manager.
     def validate_parameters(self):
         super().validate_parameters()
 
-        entered_language = self.language
-        self.language = self.language.lower()
         self.launcher_dir_name = self.language
         self.resource_dir_name = self.language
 
         if self.dask:
             if self.language != PYTHON:
                 self.log.warning(
-                    "Dask support only works with Python, changing language from {} to Python.".format(
-                        entered_language
-                    )
+                    f"Dask support only works with Python, changing language from {self.language} to Python."
                 )
                 self.language = PYTHON
             # if kernel and display names are still defaulted, silently change to dask defaults
@@ -206,13 +200,14 @@ HADOOP_CONFIG_DIR to determine the active resource manager.
     @overrides
     def add_optional_config_entries(self, config_stanza: dict) -> None:
         super().add_optional_config_entries(config_stanza)
-        if self.yarn_endpoint and self.yarn_endpoint != self.yarn_endpoint_default():
+        if self.yarn_endpoint and self.yarn_endpoint != self._yarn_endpoint_default():
             config_stanza["yarn_endpoint"] = self.yarn_endpoint
-        if self.alt_yarn_endpoint and self.alt_yarn_endpoint != self.alt_yarn_endpoint_default():
+        if self.alt_yarn_endpoint and self.alt_yarn_endpoint != self._alt_yarn_endpoint_default():
             config_stanza["alt_yarn_endpoint"] = self.alt_yarn_endpoint
         if (
             self.yarn_endpoint_security_enabled
-            and self.yarn_endpoint_security_enabled != self.yarn_endpoint_security_enabled_default()
+            and self.yarn_endpoint_security_enabled
+            != self._yarn_endpoint_security_enabled_default()
         ):
             config_stanza["yarn_endpoint_security_enabled"] = self.yarn_endpoint_security_enabled
 
@@ -225,16 +220,17 @@ HADOOP_CONFIG_DIR to determine the active resource manager.
 
         # If this is a python kernel, attempt to get the path to the py4j file.
         if self.language == PYTHON and not self.dask:
+            py4j_zip = None
             try:
-                python_lib_contents = os.listdir(f"{self.spark_home}/python/lib")
-                py4j_zip = next(
-                    iter(filter(lambda filename: "py4j" in filename, python_lib_contents))
-                )
-
+                with os.scandir(f"{self.spark_home}/python/lib") as entries:
+                    py4j_zip = next((entry.name for entry in entries if "py4j" in entry.name), None)
+            except OSError:
+                pass
+            if py4j_zip:
                 # This is always a sub-element of a path, so let's prefix with colon
                 substitutions["py4j_path"] = f":{self.spark_home}/python/lib/{py4j_zip}"
-            except OSError:
-                self.log.warn("Unable to find py4j, installing without PySpark support.")
+            else:
+                self.log.warning("Unable to find py4j, installing without PySpark support.")
         return substitutions
 
 
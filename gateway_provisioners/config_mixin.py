@@ -57,8 +57,8 @@ options must be provided for each entry.
 
     @default("unauthorized_users")
     def _unauthorized_users_default(self):
-        return os.getenv(self.unauthorized_users_env, self.unauthorized_users_default_value).split(
-            ","
+        return set(
+            os.getenv(self.unauthorized_users_env, self.unauthorized_users_default_value).split(",")
         )
 
     # Port range
@@ -3,33 +3,35 @@
 """Code related to managing kernels running in containers."""
 from __future__ import annotations
 
+import asyncio
 import os
 import signal
 from abc import abstractmethod
-from typing import Any
+from typing import AbstractSet, Any
 
 import urllib3  # docker ends up using this and it causes lots of noise, so turn off warnings
-from jupyter_client import localinterfaces
 from overrides import overrides
 from traitlets import Unicode, default
 
+from .config_mixin import poll_interval
 from .remote_provisioner import RemoteProvisionerBase
 
 urllib3.disable_warnings()
 
-local_ip = localinterfaces.public_ips()[0]
-
 default_kernel_uid = "1000"  # jovyan user is the default
 default_kernel_gid = "100"  # users group is the default
 
 # These could be enforced via a PodSecurityPolicy, but those affect
 # all pods so the cluster admin would need to configure those for
 # all applications.
-prohibited_uids = os.getenv("GP_PROHIBITED_UIDS", "0").split(",")
-prohibited_gids = os.getenv("GP_PROHIBITED_GIDS", "0").split(",")
+prohibited_uids = frozenset(os.getenv("GP_PROHIBITED_UIDS", "0").split(","))
+prohibited_gids = frozenset(os.getenv("GP_PROHIBITED_GIDS", "0").split(","))
 
 mirror_working_dirs = bool(os.getenv("GP_MIRROR_WORKING_DIRS", "false").lower() == "true")
 
+# The longest time (in seconds) between container status queries while awaiting kernel startup.
+max_status_poll_interval = float(os.getenv("GP_MAX_STATUS_POLL_INTERVAL", "2.0"))
+
 
 class ContainerProvisionerBase(RemoteProvisionerBase):
     """Kernel provisioner for container-based kernels."""
@@ -65,6 +67,8 @@ container-based kernels within Spark environments. (GP_EXECUTOR_IMAGE_NAME env v
 
         self.container_name = None
         self.assigned_node_ip = None
+        # Serializes container manager calls - see _run_blocking()
+        self._container_manager_lock: asyncio.Lock | None = None
 
     @property
     @overrides
@@ -80,16 +84,14 @@ container-based kernels within Spark environments. (GP_EXECUTOR_IMAGE_NAME env v
 
         kwargs = await super().pre_launch(**kwargs)
 
-        kwargs["env"]["KERNEL_IMAGE"] = self.image_name
-        kwargs["env"]["KERNEL_EXECUTOR_IMAGE"] = self.executor_image_name
+        env = kwargs["env"]
+        env["KERNEL_IMAGE"] = self.image_name
+        env["KERNEL_EXECUTOR_IMAGE"] = self.executor_image_name
 
-        if (
-            not mirror_working_dirs
-        ):  # If mirroring is not enabled, remove working directory if present
-            if "KERNEL_WORKING_DIR" in kwargs["env"]:
-                del kwargs["env"]["KERNEL_WORKING_DIR"]
+        if not mirror_working_dirs:  # If mirroring is not enabled, remove working directory
+            env.pop("KERNEL_WORKING_DIR", None)
 
-        self._enforce_prohibited_ids(**kwargs)
+        self._enforce_prohibited_ids(env)
         return kwargs
 
     @overrides
@@ -99,10 +101,10 @@ container-based kernels within Spark environments. (GP_EXECUTOR_IMAGE_NAME env v
             f"KernelID: {self.kernel_id}, cmd: '{cmd}'"
         )
 
-    def _enforce_prohibited_ids(self, **kwargs):
+    def _enforce_prohibited_ids(self, env: dict[str, Any]) -> None:
         """Determine UID and GID with which to launch container and ensure they are not prohibited."""
-        kernel_uid = kwargs["env"].get("KERNEL_UID", default_kernel_uid)
-        kernel_gid = kwargs["env"].get("KERNEL_GID", default_kernel_gid)
+        kernel_uid = env.get("KERNEL_UID", default_kernel_uid)
+        kernel_gid = env.get("KERNEL_GID", default_kernel_gid)
 
         if kernel_uid in prohibited_uids:
             error_message = (
@@ -116,8 +118,8 @@ container-based kernels within Spark environments. (GP_EXECUTOR_IMAGE_NAME env v
             self.log_and_raise(PermissionError(error_message))
 
         # Ensure the kernel's env has what it needs in case they came from defaults
-        kwargs["env"]["KERNEL_UID"] = kernel_uid
-        kwargs["env"]["KERNEL_GID"] = kernel_gid
+        env["KERNEL_UID"] = kernel_uid
+        env["KERNEL_GID"] = kernel_gid
 
     @overrides
     async def poll(self) -> int | None:
@@ -132,7 +134,7 @@ container-based kernels within Spark environments. (GP_EXECUTOR_IMAGE_NAME env v
         """
         result: int | None = 0
 
-        container_status = self.get_container_status(None)
+        container_status = await self._run_blocking(self.get_container_status, None)
         # Do not check whether container_status is None
         # EG couldn't restart kernels although connections exists.
         # See https://github.com/jupyter/enterprise_gateway/issues/827
@@ -145,6 +147,8 @@ container-based kernels within Spark environments. (GP_EXECUTOR_IMAGE_NAME env v
     async def send_signal(self, signum: int) -> None:
         """Send signal `signum` to container."""
         if signum == 0:
+            if self.container_name is None:  # Nothing has been launched, so nothing to probe
+                return
             await self.poll()
         elif signum == signal.SIGKILL:
             await self.kill()
@@ -158,7 +162,7 @@ container-based kernels within Spark environments. (GP_EXECUTOR_IMAGE_NAME env v
         """Kills a containerized kernel."""
 
         if self.container_name:  # We only have something to terminate if we have a name
-            self.terminate_container_resources(restart=restart)
+            await self._run_blocking(self._terminate_launched_container, restart)
 
     @overrides
     async def terminate(self, restart: bool = False) -> None:
@@ -173,7 +177,7 @@ container-based kernels within Spark environments. (GP_EXECUTOR_IMAGE_NAME env v
     async def shutdown_listener(self, restart: bool) -> None:
         await super().shutdown_listener(restart)
         if self.container_name:  # We only have something to terminate if we have a name
-            self.terminate_container_resources(restart)
+            await self._run_blocking(self._terminate_launched_container, restart)
 
     @overrides
     async def confirm_remote_startup(self):
@@ -181,12 +185,24 @@ container-based kernels within Spark environments. (GP_EXECUTOR_IMAGE_NAME env v
         self.log.debug("Trying to confirm kernel container startup status")
         self.start_time = RemoteProvisionerBase.get_current_time()
         i = 0
+        # Status queries hit the container manager's API.  Until the container reports its host
+        # (or an error state) they're issued on every iteration.  After that, only error states
+        # remain to be detected, so they're spaced out (doubling up to max_status_poll_interval)
+        # while the launch timeout and connection information are still checked on every iteration.
+        next_status_query = 1
+        status_query_spacing = 1
+        max_status_query_spacing = max(1, int(max_status_poll_interval / poll_interval))
+        container_status = None
         ready_to_connect = False  # we're ready to connect when we have a connection file to use
         while not ready_to_connect:
             i += 1
             await self.handle_launch_timeout()
 
-            container_status = self.get_container_status(str(i))
+            if i >= next_status_query:
+                container_status = await self._run_blocking(self.get_container_status, str(i))
+                next_status_query = i + status_query_spacing
+                if self.assigned_host != "":
+                    status_query_spacing = min(status_query_spacing * 2, max_status_query_spacing)
             if container_status:
                 if container_status in self.get_error_states():
                     reason = f"Error starting kernel container; status: '{container_status}'.  Check server logs."
@@ -218,13 +234,29 @@ container-based kernels within Spark environments. (GP_EXECUTOR_IMAGE_NAME env v
         await super().load_provisioner_info(provisioner_info)
         self.assigned_node_ip = provisioner_info.get("assigned_node_ip")
 
+    async def _run_blocking(self, func, *args):
+        """Runs func in the loop's default executor since container manager clients block on I/O.
+
+        Calls are serialized (e.g., a restarter's poll() during kill()) since status queries and
+        terminations update the same container state (container_name, cached service objects).
+        """
+        if self._container_manager_lock is None:  # Create within the loop that uses it
+            self._container_manager_lock = asyncio.Lock()
+        async with self._container_manager_lock:
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def _terminate_launched_container(self, restart: bool) -> None:
+        """Terminates the container's resources unless a prior termination has already done so."""
+        if self.container_name:
+            self.terminate_container_resources(restart)
+
     @abstractmethod
-    def get_initial_states(self) -> set[str]:
+    def get_initial_states(self) -> AbstractSet[str]:
         """Return list of states (in lowercase) indicating container is starting (includes running)."""
         raise NotImplementedError
 
     @abstractmethod
-    def get_error_states(self) -> set[str]:
+    def get_error_states(self) -> AbstractSet[str]:
         """Returns the list of error states (in lowercase)."""
         raise NotImplementedError
 
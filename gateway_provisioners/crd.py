@@ -5,7 +5,7 @@
 import logging
 import re
 from contextlib import suppress
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from overrides import overrides
 
@@ -21,6 +21,12 @@ except ImportError:
 
 from .k8s import KubernetesProvisioner
 
+# Extracts the text following "Exception:" from a custom resource's error message
+exception_text_pattern = re.compile(r"Exception\s*:\s*(.*)", re.MULTILINE)
+
+# Application states (in lowercase) indicating the custom resource is starting or running
+crd_initial_states = frozenset({"submitted", "pending", "running"})
+
 
 class CustomResourceProvisioner(KubernetesProvisioner):
     """A custom resource provisioner."""
@@ -36,16 +42,19 @@ class CustomResourceProvisioner(KubernetesProvisioner):
         super().__init__(**kwargs)
         self.group = self.version = self.plural = None
         self.kernel_resource_name = None
+        # Reused across status polls so each poll doesn't construct (and tear down) an API client
+        self.custom_objects_api = client.CustomObjectsApi()
 
     @overrides
     async def pre_launch(self, **kwargs: Any) -> Dict[str, Any]:
         """Launch the process for a kernel."""
         kwargs = await super().pre_launch(**kwargs)
         self.kernel_resource_name = self._determine_kernel_pod_name(**kwargs)
-        kwargs["env"]["KERNEL_RESOURCE_NAME"] = self.kernel_resource_name
-        kwargs["env"]["KERNEL_CRD_GROUP"] = self.group
-        kwargs["env"]["KERNEL_CRD_VERSION"] = self.version
-        kwargs["env"]["KERNEL_CRD_PLURAL"] = self.plural
+        env = kwargs["env"]
+        env["KERNEL_RESOURCE_NAME"] = self.kernel_resource_name
+        env["KERNEL_CRD_GROUP"] = self.group
+        env["KERNEL_CRD_VERSION"] = self.version
+        env["KERNEL_CRD_PLURAL"] = self.plural
         return kwargs
 
     @overrides
@@ -71,7 +80,7 @@ class CustomResourceProvisioner(KubernetesProvisioner):
         application_state = ""
 
         with suppress(Exception):
-            custom_resource = client.CustomObjectsApi().get_namespaced_custom_object(
+            custom_resource = self.custom_objects_api.get_namespaced_custom_object(
                 self.group,
                 self.version,
                 self.kernel_namespace,
@@ -80,11 +89,12 @@ class CustomResourceProvisioner(KubernetesProvisioner):
             )
 
             if custom_resource:
-                application_state = custom_resource["status"]["applicationState"]["state"].lower()
+                application_state_info = custom_resource["status"]["applicationState"]
+                application_state = application_state_info["state"].lower()
 
                 if application_state in self.get_error_states():
                     exception_text = CustomResourceProvisioner._get_exception_text(
-                        custom_resource["status"]["applicationState"]["errorMessage"]
+                        application_state_info["errorMessage"]
                     )
                     error_message = (
                         f"CRD submission for kernel {self.kernel_id} failed: {exception_text}"
@@ -97,9 +107,14 @@ class CustomResourceProvisioner(KubernetesProvisioner):
         # check for running state to avoid double logging with superclass
         if iteration and application_state != "running":
             self.log.debug(
-                f"{iteration}: Waiting from CRD status from resource manager {self.object_kind.lower()} in "
-                f"namespace '{self.kernel_namespace}'. Name: '{self.kernel_resource_name}', "
-                f"Status: '{application_state}', KernelID: '{self.kernel_id}'"
+                "%s: Waiting from CRD status from resource manager %s in namespace '%s'. "
+                "Name: '%s', Status: '%s', KernelID: '%s'",
+                iteration,
+                self.object_kind.lower(),
+                self.kernel_namespace,
+                self.kernel_resource_name,
+                application_state,
+                self.kernel_id,
             )
 
         return application_state
@@ -113,7 +128,7 @@ class CustomResourceProvisioner(KubernetesProvisioner):
 
         Note: the caller is responsible for handling exceptions.
         """
-        delete_status = client.CustomObjectsApi().delete_namespaced_custom_object(
+        delete_status = self.custom_objects_api.delete_namespaced_custom_object(
             self.group,
             self.version,
             self.kernel_namespace,
@@ -128,13 +143,13 @@ class CustomResourceProvisioner(KubernetesProvisioner):
         return result
 
     @overrides
-    def get_initial_states(self) -> Set[str]:
+    def get_initial_states(self) -> FrozenSet[str]:
         """Return list of states in lowercase indicating container is starting (includes running)."""
-        return {"submitted", "pending", "running"}
+        return crd_initial_states
 
     @staticmethod
     def _get_exception_text(error_message) -> str:
-        match = re.search(r"Exception\s*:\s*(.*)", error_message, re.MULTILINE)
+        match = exception_text_pattern.search(error_message)
 
         if match:
             error_message = match.group(1)
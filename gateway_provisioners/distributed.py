@@ -10,7 +10,9 @@ import os
 import signal
 import subprocess
 import warnings
-from socket import gethostbyname, gethostname
+from collections import Counter
+from operator import itemgetter
+from socket import AF_INET, gethostbyname, gethostname
 from typing import Any, cast
 
 import paramiko
@@ -24,6 +26,8 @@ from .remote_provisioner import RemoteProvisionerBase
 # would prefer /var/log, but its only writable by root
 kernel_log_dir = os.getenv("GP_KERNEL_LOG_DIR", "/tmp")  # noqa: S108
 
+load_balancing_algorithms = frozenset({"round-robin", "least-connection"})
+
 
 class TrackKernelOnHost:
     """
@@ -32,8 +36,9 @@ class TrackKernelOnHost:
     request.
     """
 
-    _host_kernels: dict = {}
-    _kernel_host_mapping: dict = {}
+    def __init__(self):
+        self._host_kernels: Counter[str] = Counter()
+        self._kernel_host_mapping: dict[str, str] = {}
 
     def add_kernel_id(self, host: str, kernel_id: str) -> None:
         self._kernel_host_mapping[kernel_id] = host
@@ -48,15 +53,13 @@ class TrackKernelOnHost:
     def min_or_remote_host(self, remote_host: str | None = None) -> str:
         if remote_host:
             return remote_host
-        return min(self._host_kernels, key=lambda k: self._host_kernels[k])
+        return min(self._host_kernels.items(), key=itemgetter(1))[0]
 
     def increment(self, host: str) -> None:
-        val = int(self._host_kernels.get(host, 0))
-        self._host_kernels[host] = val + 1
+        self._host_kernels[host] += 1
 
     def decrement(self, host: str) -> None:
-        val = int(self._host_kernels.get(host, 0))
-        self._host_kernels[host] = val - 1
+        self._host_kernels[host] -= 1
 
     def init_host_kernels(self, hosts) -> None:
         if len(self._host_kernels) == 0:
@@ -68,6 +71,7 @@ class DistributedProvisioner(RemoteProvisionerBase):
     Kernel lifecycle management for clusters via ssh and a set of hosts.
     """
 
+    # Shared across all instances since each kernel has its own provisioner instance
     host_index = 0
     kernel_on_host = TrackKernelOnHost()
 
@@ -103,11 +107,12 @@ Must be one of "round-robin" or "least-connection".  (GP_LOAD_BALANCING_ALGORITH
     @validate("load_balancing_algorithm")
     def _validate_load_balancing_algorithm(self, proposal: dict[str, str]) -> str:
         value = proposal["value"]
-        try:
-            assert value in ["round-robin", "least-connection"]
-        except ValueError as ve:
-            err_msg = f"Invalid load_balancing_algorithm value {value}, not in [round-robin,least-connection]"
-            raise TraitError(err_msg) from ve
+        if value not in load_balancing_algorithms:
+            err_msg = (
+                f"Invalid load_balancing_algorithm value {value}, "
+                f"not in {sorted(load_balancing_algorithms)}"
+            )
+            raise TraitError(err_msg)
         return value
 
     def __init__(self, **kwargs):
@@ -145,7 +150,11 @@ Must be one of "round-robin" or "least-connection".  (GP_LOAD_BALANCING_ALGORITH
         self.kernel_log = None
         env_dict = kwargs.get("env", {})
         self.assigned_host = self._determine_next_host(env_dict)
-        self.ip = gethostbyname(self.assigned_host)  # convert to ip if host is provided
+        # convert to ip if host is provided - resolving via the loop so DNS doesn't block it
+        addr_info = await asyncio.get_running_loop().getaddrinfo(
+            self.assigned_host, None, family=AF_INET
+        )
+        self.ip = addr_info[0][4][0]
         self.assigned_ip = self.ip
 
         launch_kwargs = RemoteProvisionerBase._scrub_kwargs(kwargs)
@@ -153,7 +162,7 @@ Must be one of "round-robin" or "least-connection".  (GP_LOAD_BALANCING_ALGORITH
             f"DistributedProvisioner.launch_kernel() env: {launch_kwargs.get('env', {})}"
         )
         try:
-            result_pid = self._launch_remote_process(cmd, **launch_kwargs)
+            result_pid = await self._launch_remote_process(cmd, **launch_kwargs)
             self.pid = int(result_pid)
         except Exception as e:
             error_message = (
@@ -182,12 +191,18 @@ Must be one of "round-robin" or "least-connection".  (GP_LOAD_BALANCING_ALGORITH
             self.log.debug("Distributed: kill: already terminated.")
             return None
         await self.terminate()  # Send -15 signal first
-        i = 1
-        while await self.poll() is None and i <= max_poll_attempts:
-            await asyncio.sleep(poll_interval)
-            i = i + 1
-        if i > max_poll_attempts:  # Send -9 signal if process is still alive
-            await self.send_signal(signal.SIGKILL)
+        # Most kernels exit promptly, so check back quickly at first, backing off to poll_interval
+        # while allowing the same overall time (max_poll_attempts * poll_interval) to terminate.
+        delay = poll_interval / 16
+        remaining = max_poll_attempts * poll_interval
+        while await self.poll() is None:
+            if remaining <= 0:  # Send -9 signal if process is still alive
+                await self.send_signal(signal.SIGKILL)
+                break
+            delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+            remaining -= delay
+            delay = min(delay * 2, poll_interval)
 
     @overrides
     async def terminate(self, restart=False) -> None:
@@ -208,16 +223,18 @@ Must be one of "round-robin" or "least-connection".  (GP_LOAD_BALANCING_ALGORITH
         ready_to_connect = False  # we're ready to connect when we have a connection file to use
         while not ready_to_connect:
             i += 1
-            await self.handle_launch_timeout()
-
             self.log.debug(
-                "{}: Waiting to connect.  Host: '{}', KernelID: '{}'".format(
-                    i, self.assigned_host, self.kernel_id
-                )
+                "%s: Waiting to connect.  Host: '%s', KernelID: '%s'",
+                i,
+                self.assigned_host,
+                self.kernel_id,
             )
 
-            if self.assigned_host != "":
-                ready_to_connect = await self.receive_connection_info()
+            # The host is known from launch, so rather than sleeping between brief checks, wait
+            # on the response itself - connecting as soon as the kernel's launcher responds.
+            ready_to_connect = await self.receive_connection_info(wait_timeout=poll_interval)
+            if not ready_to_connect:
+                await self._check_launch_timeout()
 
     @overrides
     def log_kernel_launch(self, cmd: list[str]) -> None:
@@ -227,17 +244,18 @@ Must be one of "round-robin" or "least-connection".  (GP_LOAD_BALANCING_ALGORITH
             f"Log file: {self.assigned_host}:{self.kernel_log}, cmd: '{cmd}'."
         )
 
-    def _launch_remote_process(self, cmd: list[str], **kwargs: Any):
+    async def _launch_remote_process(self, cmd: list[str], **kwargs: Any):
         """
         Launch the kernel as indicated by the argv stanza in the kernelspec.  Note that this method
         will bypass use of ssh if the remote host is also the local machine.
         """
 
-        cmd = self._build_startup_command(cmd, **kwargs)
+        is_local = RemoteProvisionerBase.ip_is_local(self.ip)
+        cmd = self._build_startup_command(cmd, is_local, **kwargs)
         self.log.debug(f"Invoking cmd: '{cmd}' on host: {self.assigned_host}")
         result_pid = "bad_pid"  # purposely initialize to bad int value
 
-        if RemoteProvisionerBase.ip_is_local(self.ip):
+        if is_local:
             # launch the local command with redirection in place
             assert self.kernel_log is not None
             self.local_stdout = cast(int, open(self.kernel_log, mode="a"))
@@ -246,14 +264,15 @@ Must be one of "round-robin" or "least-connection".  (GP_LOAD_BALANCING_ALGORITH
             )
             result_pid = str(self.local_proc.pid)
         else:
-            # launch remote command via ssh
-            result = self._rsh(self.ip, "".join(cmd))
+            # launch remote command via ssh - in a worker thread since paramiko blocks
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, self._rsh, self.ip, cmd)
             for line in result:
                 result_pid = line.strip()
 
         return result_pid
 
-    def _build_startup_command(self, cmd: list[str], **kwargs: Any) -> list[str]:
+    def _build_startup_command(self, cmd: list[str], is_local: bool, **kwargs: Any) -> list[str]:
         """
         Builds the command to invoke by concatenating envs from kernelspec followed by the kernel argvs.
 
@@ -268,29 +287,30 @@ Must be one of "round-robin" or "least-connection".  (GP_LOAD_BALANCING_ALGORITH
         kid = env_dict.get("KERNEL_ID")
         self.kernel_log = os.path.join(kernel_log_dir, f"kernel-{kid}.log")
 
-        if RemoteProvisionerBase.ip_is_local(self.ip):  # We're local so just use what we're given
+        if is_local:  # We're local so just use what we're given
             startup_cmd = cmd
         else:  # Add additional envs, including those in kernelspec
-            startup_cmd = ""
+            parts = []
             if kid:
-                startup_cmd += f'export KERNEL_ID="{kid}";'
+                parts.append(f'export KERNEL_ID="{kid}";')
 
             kernel_user = env_dict.get("KERNEL_USERNAME")
             if kernel_user:
-                startup_cmd += f'export KERNEL_USERNAME="{kernel_user}";'
+                parts.append(f'export KERNEL_USERNAME="{kernel_user}";')
 
             impersonation = env_dict.get("GP_IMPERSONATION_ENABLED")
             if impersonation:
-                startup_cmd += f'export GP_IMPERSONATION_ENABLED="{impersonation}";'
+                parts.append(f'export GP_IMPERSONATION_ENABLED="{impersonation}";')
 
             for key, value in self.kernel_spec.env.items():
-                startup_cmd += "export {}={};".format(key, json.dumps(value).replace("'", "''"))
+                parts.append("export {}={};".format(key, json.dumps(value).replace("'", "''")))
 
-            startup_cmd += "nohup"
+            parts.append("nohup")
             for arg in cmd:
-                startup_cmd += f" {arg}"
+                parts.append(f" {arg}")
 
-            startup_cmd += f" >> {self.kernel_log} 2>&1 & echo $!"  # return the process id
+            parts.append(f" >> {self.kernel_log} 2>&1 & echo $!")  # return the process id
+            startup_cmd = "".join(parts)
 
         return startup_cmd
 
@@ -298,15 +318,14 @@ Must be one of "round-robin" or "least-connection".  (GP_LOAD_BALANCING_ALGORITH
         """Simple round-robin index into list of hosts."""
         remote_host = env_dict.get("KERNEL_REMOTE_HOST")
         if self.least_connection:
+            DistributedProvisioner.kernel_on_host.init_host_kernels(self.remote_hosts)
             next_host = DistributedProvisioner.kernel_on_host.min_or_remote_host(remote_host)
             DistributedProvisioner.kernel_on_host.add_kernel_id(next_host, self.kernel_id)
         else:
             next_host = (
                 remote_host
                 if remote_host
-                else self.remote_hosts[
-                    DistributedProvisioner.host_index % self.remote_hosts.__len__()
-                ]
+                else self.remote_hosts[DistributedProvisioner.host_index % len(self.remote_hosts)]
             )
             DistributedProvisioner.host_index += 1
 
@@ -31,16 +31,30 @@ logging.getLogger("urllib3.connectionpool").setLevel(
 
 docker_network = os.environ.get("GP_DOCKER_NETWORK", "bridge")
 
+# A single client (and its connection pool) is shared by all provisioner instances.
+_docker_client: DockerClient | None = None
+
+
+def _get_docker_client() -> DockerClient:
+    """Returns the shared docker client, creating it from the environment on first use."""
+    global _docker_client
+    if _docker_client is None:
+        _docker_client = DockerClient.from_env()
+    return _docker_client
+
 
 class DockerSwarmProvisioner(ContainerProvisionerBase):
     """Kernel provisioner for kernels in Docker Swarm."""
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.client = DockerClient.from_env()
+        self.client = _get_docker_client()
+        # The kernel's service, once located, so polls only need to query its tasks
+        self._service: Service | None = None
 
     @overrides
     async def pre_launch(self, **kwargs: Any) -> dict[str, Any]:
+        self._service = None
         kwargs = await super().pre_launch(**kwargs)
 
         # Convey the network to the docker launch script
@@ -81,10 +95,14 @@ class DockerSwarmProvisioner(ContainerProvisionerBase):
 
         if iteration:  # only log if iteration is not None (otherwise poll() is too noisy)
             self.log.debug(
-                f"{iteration}: Waiting to connect to docker container. "
-                f"Name: '{self.container_name}', Status: '{task_state}', "
-                f"IPAddress: '{self.assigned_ip}', KernelID: '{self.kernel_id}', "
-                f"TaskID: '{task_id}'"
+                "%s: Waiting to connect to docker container. Name: '%s', Status: '%s', "
+                "IPAddress: '%s', KernelID: '%s', TaskID: '%s'",
+                iteration,
+                self.container_name,
+                task_state,
+                self.assigned_ip,
+                self.kernel_id,
+                task_id,
             )
         return task_state
 
@@ -114,6 +132,7 @@ class DockerSwarmProvisioner(ContainerProvisionerBase):
                 f"kernel ID: {self.kernel_id} has been terminated."
             )
             self.container_name = None
+            self._service = None
             result = None  # maintain jupyter contract
         else:
             self.log.warning(
@@ -125,6 +144,9 @@ class DockerSwarmProvisioner(ContainerProvisionerBase):
 
     def _get_service(self) -> Service:
         """Fetches the service object corresponding to the kernel with a matching label."""
+        if self._service is not None:
+            return self._service
+
         service = None
         services = self.client.services.list(filters={"label": "kernel_id=" + self.kernel_id})
         num_services = len(services)
@@ -138,6 +160,7 @@ class DockerSwarmProvisioner(ContainerProvisionerBase):
         else:
             service = services[0]
             self.container_name = service.name
+            self._service = service
         return service
 
     def _get_task(self) -> dict | None:
@@ -148,9 +171,14 @@ class DockerSwarmProvisioner(ContainerProvisionerBase):
         task = None
         service = self._get_service()
         if service:
-            tasks = service.tasks(filters={"desired-state": "running"})
+            try:
+                tasks = service.tasks(filters={"desired-state": "running"})
+            except NotFound:
+                tasks = []
             num_tasks = len(tasks)
             if num_tasks != 1:
+                # Re-locate the service on the next call in case it no longer exists
+                self._service = None
                 if num_tasks > 1:
                     err_msg = (
                         f"{self.__class__.__name__}: Found more than one task ({num_tasks}) "
@@ -167,7 +195,7 @@ class DockerProvisioner(ContainerProvisionerBase):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.client = DockerClient.from_env()
+        self.client = _get_docker_client()
 
     @overrides
     async def pre_launch(self, **kwargs: Any) -> dict[str, Any]:
@@ -218,9 +246,13 @@ class DockerProvisioner(ContainerProvisionerBase):
 
         if iteration:  # only log if iteration is not None (otherwise poll() is too noisy)
             self.log.debug(
-                f"{iteration}: Waiting to connect to docker container. "
-                f"Name: '{self.container_name}', Status: '{container_status}', "
-                f"IPAddress: '{self.assigned_ip}', KernelID: '{self.kernel_id}'"
+                "%s: Waiting to connect to docker container. Name: '%s', Status: '%s', "
+                "IPAddress: '%s', KernelID: '%s'",
+                iteration,
+                self.container_name,
+                container_status,
+                self.assigned_ip,
+                self.kernel_id,
             )
 
         return container_status
@@ -5,7 +5,7 @@
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional
 
 import urllib3
 from overrides import overrides
@@ -42,6 +42,18 @@ kpt_dir = os.environ.get("GP_POD_TEMPLATE_DIR", "/tmp")  # noqa: S108
 
 app_name = os.environ.get("GP_APP_NAME", "gateway-provisioners")
 
+# Pod phases (in lowercase) polled against during startup and liveness checks
+pod_initial_states = frozenset({"pending", "running"})
+pod_error_states = frozenset({"failed"})
+
+# Matches runs of characters that are not valid in a DNS-compatible pod name
+pod_name_invalid_chars_pattern = re.compile(r"[^\da-z]+")
+
+# Options used for all pod and namespace deletions (the client only reads them when serializing)
+background_delete_options = client.V1DeleteOptions(
+    grace_period_seconds=0, propagation_policy="Background"
+)
+
 if (
     "SPHINX_BUILD_IN_PROGRESS" not in os.environ
     and "PYTEST_CURRENT_TEST" not in os.environ
@@ -72,6 +84,9 @@ class KubernetesProvisioner(ContainerProvisionerBase):
         # set to true when restarting kernels during the original pod's termination
         # and if the kernel resides in its own namespace.
         self.restarting = False
+        # Reused across status polls and terminations so each call doesn't construct
+        # (and tear down) an API client and its connection pool
+        self.core_v1_api = client.CoreV1Api()
 
     @overrides
     async def pre_launch(self, **kwargs: Any) -> Dict[str, Any]:
@@ -106,23 +121,25 @@ class KubernetesProvisioner(ContainerProvisionerBase):
         self.delete_kernel_namespace = provisioner_info["delete_ns"]
 
     @overrides
-    def get_initial_states(self) -> Set[str]:
-        return {"pending", "running"}
+    def get_initial_states(self) -> FrozenSet[str]:
+        return pod_initial_states
 
     @overrides
-    def get_error_states(self) -> Set[str]:
-        return {"failed"}
+    def get_error_states(self) -> FrozenSet[str]:
+        return pod_error_states
 
     @overrides
     def get_container_status(self, iteration: Optional[str]) -> str:
         # Locates the kernel pod using the kernel_id selector.  Note that we also include 'component=kernel'
-        # in the selector so that executor pods (when Spark is in use) are not considered.
+        # in the selector so that executor pods (when Spark is in use) are not considered.  Once the
+        # pod has been located, subsequent queries select it by name.
         # If the phase indicates Running, the pod's IP is used for the assigned_ip.
         pod_status = ""
-        kernel_label_selector = f"kernel_id={self.kernel_id},component=kernel"
-        ret = client.CoreV1Api().list_namespaced_pod(
-            namespace=self.kernel_namespace, label_selector=kernel_label_selector
-        )
+        if self.container_name:
+            selector = {"field_selector": f"metadata.name={self.container_name}"}
+        else:
+            selector = {"label_selector": f"kernel_id={self.kernel_id},component=kernel"}
+        ret = self.core_v1_api.list_namespaced_pod(namespace=self.kernel_namespace, **selector)
         if ret and ret.items:
             pod_info = ret.items[0]
             self.container_name = pod_info.metadata.name
@@ -136,10 +153,14 @@ class KubernetesProvisioner(ContainerProvisionerBase):
 
         if iteration:  # only log if iteration is not None (otherwise poll() is too noisy)
             self.log.debug(
-                f"{iteration}: Waiting to connect to k8s pod in namespace "
-                f"'{self.kernel_namespace}'. Name: '{self.container_name}', "
-                f"Status: '{pod_status}', Pod IP: '{self.assigned_ip}', "
-                f"KernelID: '{self.kernel_id}'"
+                "%s: Waiting to connect to k8s pod in namespace '%s'. Name: '%s', "
+                "Status: '%s', Pod IP: '%s', KernelID: '%s'",
+                iteration,
+                self.kernel_namespace,
+                self.container_name,
+                pod_status,
+                self.assigned_ip,
+                self.kernel_id,
             )
 
         return pod_status
@@ -152,13 +173,13 @@ class KubernetesProvisioner(ContainerProvisionerBase):
 
         Note: the caller is responsible for handling exceptions.
         """
-        body = client.V1DeleteOptions(grace_period_seconds=0, propagation_policy="Background")
-
         # Deleting a Pod will return a v1.Pod if found and its status will be a PodStatus containing
         # a phase string property
         # https://kubernetes.io/docs/reference/generated/kubernetes-api/v1.21/#podstatus-v1-core
-        v1_pod = client.CoreV1Api().delete_namespaced_pod(
-            namespace=self.kernel_namespace, body=body, name=self.container_name
+        v1_pod = self.core_v1_api.delete_namespaced_pod(
+            namespace=self.kernel_namespace,
+            body=background_delete_options,
+            name=self.container_name,
         )
         status = None
         if v1_pod and v1_pod.status:
@@ -202,11 +223,8 @@ class KubernetesProvisioner(ContainerProvisionerBase):
                 object_type = "Namespace"
                 # Status is a return value for calls that don't return other objects.
                 # https://kubernetes.io/docs/reference/generated/kubernetes-api/v1.21/#status-v1-meta
-                body = client.V1DeleteOptions(
-                    grace_period_seconds=0, propagation_policy="Background"
-                )
-                v1_status = client.CoreV1Api().delete_namespace(
-                    name=self.kernel_namespace, body=body
+                v1_status = self.core_v1_api.delete_namespace(
+                    name=self.kernel_namespace, body=background_delete_options
                 )
                 status = None
                 if v1_status:
@@ -258,11 +276,7 @@ class KubernetesProvisioner(ContainerProvisionerBase):
 
         # Rewrite pod_name to be compatible with DNS name convention
         # And put back into env since kernel needs this
-        pod_name = re.sub(r"[^\da-z]+", "-", pod_name.lower())
-        while pod_name.startswith("-"):
-            pod_name = pod_name[1:]
-        while pod_name.endswith("-"):
-            pod_name = pod_name[:-1]
+        pod_name = pod_name_invalid_chars_pattern.sub("-", pod_name.lower()).strip("-")
         kwargs["env"]["KERNEL_POD_NAME"] = pod_name
 
         return pod_name
@@ -319,7 +333,7 @@ class KubernetesProvisioner(ContainerProvisionerBase):
 
         # create the namespace
         try:
-            client.CoreV1Api().create_namespace(body=body)
+            self.core_v1_api.create_namespace(body=body)
             self.delete_kernel_namespace = True
             self.log.info(f"Created kernel namespace: {namespace}")
 
@@ -339,10 +353,9 @@ class KubernetesProvisioner(ContainerProvisionerBase):
                         f"Error occurred creating role binding for namespace '{namespace}': {err}"
                     )
                     # delete the namespace since we'll be using the EG namespace...
-                    body = client.V1DeleteOptions(
-                        grace_period_seconds=0, propagation_policy="Background"
+                    self.core_v1_api.delete_namespace(
+                        name=namespace, body=background_delete_options
                     )
-                    client.CoreV1Api().delete_namespace(name=namespace, body=body)
                     self.log.warning(f"Deleted kernel namespace: {namespace}")
                 else:
                     reason = f"Error occurred creating namespace '{namespace}': {err}"
@@ -284,6 +284,10 @@ class RemoteProvisionerBase(RemoteProvisionerConfigMixin, KernelProvisionerBase)
         Checks to see if the kernel launch timeout has been exceeded while awaiting connection info.
         """
         await asyncio.sleep(poll_interval)
+        await self._check_launch_timeout()
+
+    async def _check_launch_timeout(self):
+        """Kills the kernel and raises TimeoutError if the launch timeout has been exceeded."""
         time_interval = RemoteProvisionerBase.get_time_diff(
             self.start_time  # type:ignore[arg-type]
         )
@@ -374,14 +378,19 @@ class RemoteProvisionerBase(RemoteProvisionerConfigMixin, KernelProvisionerBase)
                 comm_port_tunnel.terminate()
                 del self.tunnel_processes[comm_port_name]
 
-    async def receive_connection_info(self) -> bool:
+    async def receive_connection_info(self, wait_timeout: Optional[float] = None) -> bool:
         """
         Monitors the response address for connection info sent by the remote kernel launcher.
+
+        If provided, wait_timeout is the number of seconds to wait for the response, otherwise a
+        brief interval is used since callers are typically already polling.
         """
         # Polls the socket using accept.  When data is found, returns ready indicator and encrypted data.
         ready_to_connect = False
         try:
-            connect_info = await self.response_manager.get_connection_info(self.kernel_id)
+            connect_info = await self.response_manager.get_connection_info(
+                self.kernel_id, wait_timeout=wait_timeout
+            )
             self._setup_connection_info(connect_info)
             ready_to_connect = True
         except Exception as e:
@@ -709,7 +718,7 @@ class RemoteProvisionerBase(RemoteProvisionerConfigMixin, KernelProvisionerBase)
                 sock.close()
         else:
             self.log.debug(
-                "Invalid comm port, not sending request '{}' to comm_port '{}'.",
+                "Invalid comm port, not sending request '%s' to comm_port '%s'.",
                 request,
                 self.comm_port,
             )
@@ -11,7 +11,7 @@ import random
 import re
 from asyncio import Event
 from socket import AF_INET, SO_REUSEADDR, SOCK_STREAM, SOL_SOCKET, socket, timeout
-from typing import Any
+from typing import Any, Optional
 
 from Cryptodome.Cipher import AES, PKCS1_v1_5
 from Cryptodome.PublicKey import RSA
@@ -133,9 +133,16 @@ class ResponseManager(SingletonConfigurable):
         """Register kernel_id so its connection information can be processed."""
         self._response_registry[kernel_id] = Response()
 
-    async def get_connection_info(self, kernel_id: str) -> dict:
-        """Performs a timeout wait on the event, returning the connection information on completion."""
-        await asyncio.wait_for(self._response_registry[kernel_id].wait(), connection_interval)
+    async def get_connection_info(
+        self, kernel_id: str, wait_timeout: Optional[float] = None
+    ) -> dict:
+        """Performs a timeout wait on the event, returning the connection information on completion.
+
+        If wait_timeout is not provided, the (brief) connection_interval is used.
+        """
+        if wait_timeout is None:
+            wait_timeout = connection_interval
+        await asyncio.wait_for(self._response_registry[kernel_id].wait(), wait_timeout)
         return self._response_registry.pop(kernel_id).response
 
     def _prepare_response_socket(self):
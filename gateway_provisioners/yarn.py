@@ -88,12 +88,11 @@ HADOOP_CONFIG_DIR to determine the active resource manager.
 
     @default("yarn_endpoint_security_enabled")
     def _yarn_endpoint_security_enabled_default(self):
-        return bool(
-            os.getenv(
-                self.yarn_endpoint_security_enabled_env,
-                self.yarn_endpoint_security_enabled_default_value,
-            )
-        )
+        # Any set value other than "true" (case-insensitive), including "false", disables security
+        value = os.getenv(self.yarn_endpoint_security_enabled_env)
+        if value is None:
+            return self.yarn_endpoint_security_enabled_default_value
+        return value.lower() == "true"
 
     # Impersonation enabled
     impersonation_enabled_env = "GP_IMPERSONATION_ENABLED"
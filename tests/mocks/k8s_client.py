@@ -55,6 +55,13 @@ class MockCoreV1Api:
             if entry.startswith("kernel_id="):
                 kernel_id = entry.split("=")[1]
                 break
+        field_selector = kwargs.get("field_selector", "")
+        if field_selector.startswith("metadata.name="):
+            pod_name = field_selector.split("=")[1]
+            for kid, resource in k8s_resources.items():
+                if resource.pod_name == pod_name:
+                    kernel_id = kid
+                    break
         if kernel_id in k8s_resources:
             resource = k8s_resources.get(kernel_id)
             if resource.query_counter >= 3:  # time to return
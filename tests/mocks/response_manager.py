@@ -1,5 +1,6 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
+from typing import Optional
 
 response_manager_registration = {}
 
@@ -32,6 +33,8 @@ def mock_register_event(self, kernel_id: str) -> None:
     response_manager_registration[kernel_id] = {}
 
 
-async def mock_get_connection_info(self, kernel_id: str) -> dict:
+async def mock_get_connection_info(
+    self, kernel_id: str, wait_timeout: Optional[float] = None
+) -> dict:
     assert kernel_id in response_manager_registration
     return generate_connection_info(kernel_id)
@@ -0,0 +1,48 @@
+# Copyright (c) Jupyter Development Team.
+# Distributed under the terms of the Modified BSD License.
+
+import os
+
+import pytest
+
+from gateway_provisioners.cli.base_app import BaseApp, BaseSpecApp
+
+
+def test_fast_copytree(tmp_path):
+    src = tmp_path / "src"
+    (src / "scripts" / "nested").mkdir(parents=True)
+    (src / "kernel.json").write_text("{}")
+    (src / "scripts" / "launch.py").write_text("launch")
+    (src / "scripts" / "nested" / "run.sh").write_text("run")
+    (src / "scripts" / "__pycache__").mkdir()
+    (src / "scripts" / "__pycache__" / "launch.pyc").write_text("pyc")
+    os.chmod(src / "scripts" / "nested" / "run.sh", 0o755)
+
+    # dst already exists and has content that must be preserved or overwritten
+    dst = tmp_path / "dst"
+    (dst / "scripts").mkdir(parents=True)
+    (dst / "existing.txt").write_text("existing")
+    (dst / "scripts" / "launch.py").write_text("stale")
+
+    BaseApp._fast_copytree(str(src), str(dst), ignore=frozenset({"__pycache__"}))
+
+    assert (dst / "existing.txt").read_text() == "existing"
+    assert (dst / "kernel.json").read_text() == "{}"
+    assert (dst / "scripts" / "launch.py").read_text() == "launch"
+    assert (dst / "scripts" / "nested" / "run.sh").read_text() == "run"
+    assert os.access(dst / "scripts" / "nested" / "run.sh", os.X_OK)
+    assert not (dst / "scripts" / "__pycache__").exists()
+
+
+def test_copy_launcher_files_skips_toree_source(tmp_path):
+    BaseApp()._copy_launcher_files("scala", str(tmp_path))
+
+    assert not (tmp_path / "toree-launcher").exists()
+
+
+def test_install_files_invalid_kernel_name(tmp_path):
+    app = BaseSpecApp(kernel_name="my kernel", prefix=str(tmp_path))
+    with pytest.raises(SystemExit):
+        app.install_files()
+
+    assert not (tmp_path / "share").exists()
@@ -0,0 +1,41 @@
+# Copyright (c) Jupyter Development Team.
+# Distributed under the terms of the Modified BSD License.
+
+from uuid import uuid4
+
+import pytest
+from traitlets import TraitError
+
+from gateway_provisioners.distributed import TrackKernelOnHost
+
+
+def test_track_kernel_on_host():
+    tracker = TrackKernelOnHost()
+    tracker.init_host_kernels(["host1", "host2"])
+
+    tracker.add_kernel_id(tracker.min_or_remote_host(), "kernel1")
+    tracker.add_kernel_id(tracker.min_or_remote_host(), "kernel2")
+    assert tracker.min_or_remote_host("host3") == "host3"
+    tracker.add_kernel_id("host1", "kernel3")
+    assert tracker.min_or_remote_host() == "host2"
+
+    tracker.delete_kernel_id("kernel1")
+    tracker.delete_kernel_id("kernel3")
+    assert tracker.min_or_remote_host() == "host1"
+
+    # Each tracker maintains its own state
+    assert TrackKernelOnHost()._host_kernels == {}
+
+
+@pytest.mark.parametrize("algorithm", ["round-robin", "least-connection"])
+def test_load_balancing_algorithm(get_provisioner, algorithm):
+    provisioner = get_provisioner("distributed", str(uuid4()))
+    provisioner.load_balancing_algorithm = algorithm
+    assert provisioner.load_balancing_algorithm == algorithm
+
+
+def test_invalid_load_balancing_algorithm(get_provisioner):
+    provisioner = get_provisioner("distributed", str(uuid4()))
+    with pytest.raises(TraitError, match="Invalid load_balancing_algorithm value random"):
+        provisioner.load_balancing_algorithm = "random"
+    assert provisioner.load_balancing_algorithm == "round-robin"
@@ -8,6 +8,9 @@ import pytest
 from jupyter_client import KernelConnectionInfo
 from validators import TEST_USER, YarnValidator
 
+from gateway_provisioners.cli.yarn_specapp import YarnSpecInstaller
+from gateway_provisioners.yarn import YarnProvisioner
+
 YARN_SEED_ENV = {
     "KERNEL_USERNAME": TEST_USER,
     "GP_YARN_ENDPOINT": "my-yarn-cluster.acme.com:7777",
@@ -55,3 +58,17 @@ async def test_lifecycle(init_api_mocks, response_manager, get_provisioner, seed
 
     await provisioner.cleanup(restart=False)
     assert provisioner.has_process is False, "has_process property has unexpected value: True"
+
+
+@pytest.mark.parametrize(
+    "env_value,expected",
+    [(None, False), ("false", False), ("False", False), ("true", True), ("True", True)],
+)
+def test_yarn_endpoint_security_enabled_default(monkeypatch, env_value, expected):
+    if env_value is None:
+        monkeypatch.delenv("GP_YARN_ENDPOINT_SECURITY_ENABLED", raising=False)
+    else:
+        monkeypatch.setenv("GP_YARN_ENDPOINT_SECURITY_ENABLED", env_value)
+
+    assert YarnProvisioner().yarn_endpoint_security_enabled is expected
+    assert YarnSpecInstaller().yarn_endpoint_security_enabled is expected